@@ -2,11 +2,25 @@
 # generate_mock_data.py - IMPROVED VERSION
 # Ensures all charts have sufficient data for every filter combination
 
-import os, json, random
-from datetime import datetime, timedelta
-from itertools import product
+import argparse, json, os, random
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from functools import lru_cache, partial
+from itertools import islice, product
+
+import numpy as np
+
+try:  # C JSON encoder; without it lines are formatted in Python (see write_jsonl)
+    import orjson
+except ImportError:
+    orjson = None
+
+def make_rng(seed):
+    """SFC64-backed Generator: faster than the default PCG64 for bulk draws"""
+    return np.random.Generator(np.random.SFC64(seed))
 
 random.seed(42)
+rng = make_rng(42)  # Batched draws for the high-volume generators
 
 # ────────────────────────────────────────────────────────────────────────────────
 # Enhanced domains to ensure data coverage
@@ -31,6 +45,10 @@ CATEGORIES = {
 
 BRAND_TO_CATEGORY = {brand: cat for cat, brands in CATEGORIES.items() for brand in brands}
 
+# Parallel lists so per-record loops pair brand and category without a dict lookup
+BRANDS = list(BRAND_TO_CATEGORY.keys())
+BRAND_CATS = [BRAND_TO_CATEGORY[b] for b in BRANDS]
+
 COUNTRIES = ["US", "GB", "PK", "IN", "SK", "ES", "DE", "PL", "IT", "FR"]
 
 SUPPLIER_CATEGORIES = ["API", "Excipient", "Packaging", "Logistics"]
@@ -47,15 +65,15 @@ SUPPLIERS = [
 # FIXED: Consistent date handling
 # ────────────────────────────────────────────────────────────────────────────────
 
+@lru_cache(maxsize=None)
 def last_n_months(n=12):
     """Generate consistent YYYY-MM format months"""
-    now = datetime.utcnow().replace(day=1)
+    now = datetime.utcnow()
+    current = now.year * 12 + now.month - 1  # Months since year 0, so no day arithmetic can skip one
     out = []
-    for i in range(n):
-        d = datetime(now.year, now.month, 1) - timedelta(days=32*i)  # More reliable month arithmetic
-        d = d.replace(day=1)  # Ensure first of month
-        out.append(f"{d.year}-{d.month:02d}")
-    return list(reversed(out))  # oldest → newest
+    for total in range(current - n + 1, current + 1):  # oldest → newest
+        out.append(f"{total // 12}-{total % 12 + 1:02d}")
+    return tuple(out)
 
 # ────────────────────────────────────────────────────────────────────────────────
 # Enhanced generators ensuring EVERY combination has data
@@ -63,285 +81,361 @@ def last_n_months(n=12):
 
 def gen_orders(months):
     """ENHANCED: Ensure every site+category+month has orders"""
-    records = []
-    
     # Generate for EVERY combination to ensure charts always have data
-    for m in months:
-        for site in SITES:
-            for cat, brands in CATEGORIES.items():
-                # GUARANTEED minimum 20 orders per combination
-                num_orders = random.randint(20, 80)  # Reduced max to be more realistic
-                
-                for _ in range(num_orders):
-                    brand = random.choice(brands)
-                    cycle = max(5, random.gauss(14, 4))        # Ensure positive values
-                    lead = max(10, random.gauss(18, 5))        
-                    fulfilled = rand_weighted_bool(0.92)       # Slightly more realistic
-                    on_time = fulfilled and rand_weighted_bool(0.88)  # More variation
-                    perfect = on_time and rand_weighted_bool(0.94)
-                    backorder = not fulfilled and rand_weighted_bool(0.4)
-                    cpo = clamp(random.gauss(1100, 250), 500, 2500)
-                    toc = cpo * random.uniform(0.95, 1.15)     # Tighter range
-                    c2c = clamp(random.gauss(45, 10), 20, 90)
-                    visibility = clamp(random.gauss(0.82, 0.08), 0.4, 0.98)
-
-                    records.append({
-                        "month": m,
-                        "site": site["code"],
-                        "site_name": site["name"],  # Add readable name
-                        "category": cat,
-                        "brand": brand,
-                        "order_fulfilled": fulfilled,
-                        "on_time": on_time,
-                        "perfect_order": perfect,
-                        "cycle_time_days": round(cycle, 1),
-                        "supplier_lead_time": round(lead, 1),
-                        "cost_per_order": round(cpo, 2),
-                        "total_order_cost": round(toc, 2),
-                        "cash_to_cash_cycle": round(c2c, 1),
-                        "visibility_score": round(visibility, 3),
-                        "backorder": backorder,
-                    })
-    
-    print(f"Generated {len(records)} order records across {len(months)} months")
-    return records
+    groups = list(product(months, SITES, CATEGORIES.items()))
+    # GUARANTEED minimum 20 orders per combination
+    sizes = rng.integers(20, 81, len(groups))  # Reduced max to be more realistic
+    n = int(sizes.sum())
+
+    # Draw every column once for all combinations, then walk it group by group
+    cycle = clamp_array(rng.normal(14, 4, n), 5)          # Ensure positive values
+    lead = clamp_array(rng.normal(18, 5, n), 10)
+    fulfilled = rng.random(n) < 0.92                         # Slightly more realistic
+    on_time = fulfilled & (rng.random(n) < 0.88)             # More variation
+    perfect = on_time & (rng.random(n) < 0.94)
+    backorder = ~fulfilled & (rng.random(n) < 0.4)
+    cpo = clamp_array(rng.normal(1100, 250, n), 500, 2500)
+    toc = cpo * rng.uniform(0.95, 1.15, n)                   # Tighter range
+    c2c = clamp_array(rng.normal(45, 10, n), 20, 90)
+    visibility = clamp_array(rng.normal(0.82, 0.08, n), 0.4, 0.98)
+    brand_idx = rng.integers(0, np.repeat([len(brands) for _, _, (_, brands) in groups], sizes))
+
+    rows = zip(
+        brand_idx.tolist(), fulfilled.tolist(), on_time.tolist(), perfect.tolist(),
+        np.round(cycle, 1).tolist(), np.round(lead, 1).tolist(),
+        np.round(cpo, 2).tolist(), np.round(toc, 2).tolist(),
+        np.round(c2c, 1).tolist(), np.round(visibility, 3).tolist(),
+        backorder.tolist(),
+    )
+    for (m, site, (cat, brands)), size in zip(groups, sizes.tolist()):
+        site_code, site_name = site["code"], site["name"]
+        for b, ful, ot, pf, cyc, ld, cp, tc, cc, vis, bo in islice(rows, size):
+            yield {
+                "month": m,
+                "site": site_code,
+                "site_name": site_name,  # Add readable name
+                "category": cat,
+                "brand": brands[b],
+                "order_fulfilled": ful,
+                "on_time": ot,
+                "perfect_order": pf,
+                "cycle_time_days": cyc,
+                "supplier_lead_time": ld,
+                "cost_per_order": cp,
+                "total_order_cost": tc,
+                "cash_to_cash_cycle": cc,
+                "visibility_score": vis,
+                "backorder": bo,
+            }
 
 def gen_batches(months):
     """ENHANCED: Ensure every site+category+month has batches"""
-    records = []
-    
-    for m in months:
-        for site in SITES:
-            for cat in CATEGORIES.keys():
-                # GUARANTEED minimum 15 batches per combination
-                num_batches = random.randint(15, 50)
-                
-                for _ in range(num_batches):
-                    qa_days = clamp(random.gauss(5.5, 1.5), 2, 12)
-                    # Ensure mix of pass/fail for meaningful charts
-                    status = "Pass" if rand_weighted_bool(0.94) else "Fail"
-                    
-                    records.append({
-                        "month": m,
-                        "site": site["code"],
-                        "site_name": site["name"],
-                        "category": cat,
-                        "qa_days": round(qa_days, 1),
-                        "status": status,
-                    })
-    
-    print(f"Generated {len(records)} batch records")
-    return records
+    groups = list(product(months, SITES, CATEGORIES.keys()))
+    # GUARANTEED minimum 15 batches per combination
+    sizes = rng.integers(15, 51, len(groups))
+    n = int(sizes.sum())
+    qa_days = clamp_array(rng.normal(5.5, 1.5, n), 2, 12)
+    # Ensure mix of pass/fail for meaningful charts
+    passed = rng.random(n) < 0.94
+
+    rows = zip(np.round(qa_days, 1).tolist(), passed.tolist())
+    for (m, site, cat), size in zip(groups, sizes.tolist()):
+        base = {"month": m, "site": site["code"], "site_name": site["name"], "category": cat}
+        for qa, ok in islice(rows, size):
+            yield {
+                **base,
+                "qa_days": qa,
+                "status": "Pass" if ok else "Fail",
+            }
 
 def gen_labs(months):
     """ENHANCED: Ensure every site+category+month has lab data"""
-    records = []
-    
-    for m in months:
-        for site in SITES:
-            for cat in CATEGORIES.keys():
-                # GUARANTEED minimum 10 lab tests per combination
-                num_tests = random.randint(10, 30)
-                
-                for _ in range(num_tests):
-                    tat = clamp(random.gauss(4.5, 1.2), 1.0, 10.0)
-                    records.append({
-                        "month": m,
-                        "site": site["code"],
-                        "site_name": site["name"],
-                        "category": cat,
-                        "tat": round(tat, 1),
-                    })
-    
-    print(f"Generated {len(records)} lab records")
-    return records
+    groups = list(product(months, SITES, CATEGORIES.keys()))
+    # GUARANTEED minimum 10 lab tests per combination
+    sizes = rng.integers(10, 31, len(groups))
+    tat = clamp_array(rng.normal(4.5, 1.2, int(sizes.sum())), 1.0, 10.0)
+
+    rows = iter(np.round(tat, 1).tolist())
+    for (m, site, cat), size in zip(groups, sizes.tolist()):
+        base = {"month": m, "site": site["code"], "site_name": site["name"], "category": cat}
+        for t in islice(rows, size):
+            yield {
+                **base,
+                "tat": t,
+            }
 
 def gen_inventory(months):
     """ENHANCED: Ensure meaningful inventory distribution"""
-    records = []
-    
-    for m in months:
-        for site in SITES:
-            for cat in CATEGORIES.keys():
-                # Generate inventory items with guaranteed mix of statuses
-                num_items = random.randint(20, 60)
-                
-                for _ in range(num_items):
-                    # Ensure meaningful distribution of blocked vs released
-                    if random.random() < 0.12:  # 12% blocked
-                        status = "Blocked"
-                        qty = max(10, int(random.gauss(200, 100)))  # Smaller blocked quantities
-                    else:
-                        status = "Released"
-                        qty = max(50, int(random.gauss(800, 300)))  # Larger released quantities
-                    
-                    unit_cost = clamp(random.gauss(12, 4), 3, 40)
-                    # Ensure realistic expiry distribution
-                    if status == "Blocked":
-                        days_to_expiry = clamp(random.gauss(30, 15), 1, 90)  # Shorter expiry for blocked
-                    else:
-                        days_to_expiry = clamp(random.gauss(120, 60), 30, 360)  # Longer for released
-
-                    records.append({
-                        "month": m,
-                        "site": site["code"],
-                        "site_name": site["name"],
-                        "category": cat,
-                        "status": status,
-                        "qty": qty,
-                        "unit_cost": round(unit_cost, 2),
-                        "inventory_value": round(qty * unit_cost, 2),
-                        "days_to_expiry": int(days_to_expiry),
-                    })
-    
-    print(f"Generated {len(records)} inventory records")
-    return records
+    groups = list(product(months, SITES, CATEGORIES.keys()))
+    # Generate inventory items with guaranteed mix of statuses
+    sizes = rng.integers(20, 61, len(groups))
+    n = int(sizes.sum())
+
+    # Ensure meaningful distribution of blocked vs released
+    blocked = rng.random(n) < 0.12  # 12% blocked
+    qty = np.where(
+        blocked,
+        clamp_array(rng.normal(200, 100, n).astype(int), 10),  # Smaller blocked quantities
+        clamp_array(rng.normal(800, 300, n).astype(int), 50),  # Larger released quantities
+    )
+    unit_cost = clamp_array(rng.normal(12, 4, n), 3, 40)
+    # Ensure realistic expiry distribution
+    days_to_expiry = np.where(
+        blocked,
+        clamp_array(rng.normal(30, 15, n), 1, 90),    # Shorter expiry for blocked
+        clamp_array(rng.normal(120, 60, n), 30, 360), # Longer for released
+    ).astype(int)
+
+    rows = zip(
+        blocked.tolist(), qty.tolist(), np.round(unit_cost, 2).tolist(),
+        np.round(qty * unit_cost, 2).tolist(), days_to_expiry.tolist(),
+    )
+    for (m, site, cat), size in zip(groups, sizes.tolist()):
+        site_code, site_name = site["code"], site["name"]
+        for blk, q, uc, val, dte in islice(rows, size):
+            yield {
+                "month": m,
+                "site": site_code,
+                "site_name": site_name,
+                "category": cat,
+                "status": "Blocked" if blk else "Released",
+                "qty": q,
+                "unit_cost": uc,
+                "inventory_value": val,
+                "days_to_expiry": dte,
+            }
 
 def gen_reg_approvals(months):
     """ENHANCED: Ensure every country+brand+site combination has data"""
-    records = []
-    
-    # Generate for every meaningful combination
-    for m in months:
-        for site in SITES:
-            for brand in BRAND_TO_CATEGORY.keys():
-                for country in COUNTRIES[:6]:  # Limit to 6 countries to keep data manageable
-                    # Vary approval percentages to create meaningful visualizations
-                    base_pct = random.uniform(85, 98)
-                    # Add some country-specific variation
-                    country_factor = {"US": 1.02, "GB": 1.01, "DE": 0.99}.get(country, 1.0)
-                    pct = clamp(base_pct * country_factor, 70, 100)
-                    
-                    records.append({
-                        "month": m,
-                        "country": country,
-                        "brand": brand,
-                        "category": BRAND_TO_CATEGORY.get(brand),
-                        "site": site["code"],
-                        "site_name": site["name"],
-                        "pct": round(pct, 1),
-                    })
-    
-    print(f"Generated {len(records)} regulatory approval records")
-    return records
+    countries = COUNTRIES[:6]  # Limit to 6 countries to keep data manageable
+    # Generate for every meaningful combination; one draw per row, all at once
+    combos = product(months, SITES, zip(BRANDS, BRAND_CATS), countries)
+    n = len(months) * len(SITES) * len(BRANDS) * len(countries)
+
+    # Vary approval percentages to create meaningful visualizations
+    base_pct = rng.uniform(85, 98, n).reshape(-1, len(countries))
+    # Add some country-specific variation (country is the innermost product axis)
+    country_factor = np.array([{"US": 1.02, "GB": 1.01, "DE": 0.99}.get(c, 1.0) for c in countries])
+    pct = clamp_array((base_pct * country_factor).ravel(), 70, 100)
+
+    for (m, site, (brand, brand_cat), country), p in zip(combos, np.round(pct, 1).tolist()):
+        yield {
+            "month": m,
+            "country": country,
+            "brand": brand,
+            "category": brand_cat,
+            "site": site["code"],
+            "site_name": site["name"],
+            "pct": p,
+        }
 
 def gen_reg_submissions(months):
     """ENHANCED: Ensure consistent submission data"""
-    records = []
-    
-    for m in months:
-        for site in SITES:
-            for brand in list(BRAND_TO_CATEGORY.keys())[:10]:  # Limit brands for manageability
-                # Ensure some submissions every month
-                if rand_weighted_bool(0.8):  # 80% chance of submission per brand/site/month
-                    tta = clamp(random.gauss(28, 10), 7, 90)
-                    status = random.choices(["Pending", "Approved"], [0.35, 0.65])[0]
-                    records.append({
-                        "month": m,
-                        "site": site["code"],
-                        "site_name": site["name"],
-                        "brand": brand,
-                        "category": BRAND_TO_CATEGORY.get(brand),
-                        "tta": round(tta, 1),
-                        "status": status,
-                    })
-    
-    print(f"Generated {len(records)} regulatory submission records")
-    return records
+    _rnd, _gauss, _choices, _clamp = random.random, random.gauss, random.choices, clamp
+    # Limit brands for manageability
+    for m, site, (brand, brand_cat) in product(months, SITES, zip(BRANDS[:10], BRAND_CATS[:10])):
+        site_code, site_name = site["code"], site["name"]
+        # Ensure some submissions every month
+        if _rnd() < 0.8:  # 80% chance of submission per brand/site/month
+            tta = _clamp(_gauss(28, 10), 7, 90)
+            status = _choices(["Pending", "Approved"], [0.35, 0.65])[0]
+            yield {
+                "month": m,
+                "site": site_code,
+                "site_name": site_name,
+                "brand": brand,
+                "category": brand_cat,
+                "tta": round(tta, 1),
+                "status": status,
+            }
 
 def gen_supplier_performance(months):
     """ENHANCED: Ensure every supplier has monthly data"""
-    records = []
+    n = len(SUPPLIERS)
+    regions = ["EMEA", "AMER", "APAC"]
+    portfolio_cats = list(CATEGORIES.keys())
     
     for m in months:
-        for sup in SUPPLIERS:
-            region = random.choice(["EMEA", "AMER", "APAC"])
-            supplier_cat = random.choice(SUPPLIER_CATEGORIES)
-            portfolio_cat = random.choice(list(CATEGORIES.keys()))
-
-            # Add some correlation to make data more realistic
-            base_performance = random.uniform(0.8, 0.95)
-            on_time = clamp(base_performance + random.uniform(-0.05, 0.05), 0.6, 0.99)
-            quality = clamp(base_performance + random.uniform(-0.03, 0.03), 0.7, 0.995)
-            responsive = clamp(base_performance + random.uniform(-0.08, 0.08), 0.5, 0.99)
-            flexibility = clamp(base_performance + random.uniform(-0.1, 0.1), 0.5, 0.99)
-            overall = (on_time * 0.3 + quality * 0.4 + responsive * 0.15 + flexibility * 0.15) * 100
-
-            records.append({
+        region_idx = rng.integers(0, len(regions), n)
+        supplier_cat_idx = rng.integers(0, len(SUPPLIER_CATEGORIES), n)
+        portfolio_cat_idx = rng.integers(0, len(portfolio_cats), n)
+
+        # Add some correlation to make data more realistic
+        base_performance = rng.uniform(0.8, 0.95, n)
+        on_time = clamp_array(base_performance + rng.uniform(-0.05, 0.05, n), 0.6, 0.99)
+        quality = clamp_array(base_performance + rng.uniform(-0.03, 0.03, n), 0.7, 0.995)
+        responsive = clamp_array(base_performance + rng.uniform(-0.08, 0.08, n), 0.5, 0.99)
+        flexibility = clamp_array(base_performance + rng.uniform(-0.1, 0.1, n), 0.5, 0.99)
+        overall = (on_time * 0.3 + quality * 0.4 + responsive * 0.15 + flexibility * 0.15) * 100
+
+        for sup, reg, sc, pc, ot, q, r, f, o in zip(
+            SUPPLIERS, region_idx.tolist(), supplier_cat_idx.tolist(), portfolio_cat_idx.tolist(),
+            np.round(on_time * 100, 2).tolist(), np.round(quality * 100, 2).tolist(),
+            np.round(responsive * 100, 2).tolist(), np.round(flexibility * 100, 2).tolist(),
+            np.round(overall, 2).tolist(),
+        ):
+            yield {
                 "month": m,
                 "supplier_id": sup["supplier_id"],
                 "supplier_name": sup["supplier_name"],
-                "region": region,
-                "supplier_category": supplier_cat,
-                "category": portfolio_cat,
-                "on_time_delivery_pct": round(on_time * 100, 2),
-                "quality_score_pct": round(quality * 100, 2),
-                "responsiveness_pct": round(responsive * 100, 2),
-                "flexibility_pct": round(flexibility * 100, 2),
-                "overall_performance_score": round(overall, 2),
-            })
-    
-    print(f"Generated {len(records)} supplier performance records")
-    return records
+                "region": regions[reg],
+                "supplier_category": SUPPLIER_CATEGORIES[sc],
+                "category": portfolio_cats[pc],
+                "on_time_delivery_pct": ot,
+                "quality_score_pct": q,
+                "responsiveness_pct": r,
+                "flexibility_pct": f,
+                "overall_performance_score": o,
+            }
 
 def gen_deviations(months):
     """NEW: Generate deviation data for quality charts"""
-    records = []
     severities = ["Critical", "Major", "Minor"]
     root_causes = ["Equipment", "Process", "Material", "Human Error", "Environment", "Documentation"]
     
-    for m in months:
-        for site in SITES:
-            for cat in CATEGORIES.keys():
-                # Generate 2-15 deviations per site/category/month
-                num_deviations = random.randint(2, 15)
-                
-                for _ in range(num_deviations):
-                    severity = random.choices(severities, weights=[0.15, 0.35, 0.5])[0]
-                    cause = random.choice(root_causes)
-                    
-                    records.append({
-                        "month": m,
-                        "site": site["code"],
-                        "site_name": site["name"],
-                        "category": cat,
-                        "severity": severity,
-                        "root_cause": cause,
-                        "days_to_resolve": random.randint(1, 30)
-                    })
-    
-    print(f"Generated {len(records)} deviation records")
-    return records
+    for m, site, cat in product(months, SITES, CATEGORIES.keys()):
+        site_code, site_name = site["code"], site["name"]
+        base = {"month": m, "site": site_code, "site_name": site_name, "category": cat}
+        # Generate 2-15 deviations per site/category/month
+        n = rng.integers(2, 16)
+        sev_idx = rng.choice(len(severities), size=n, p=[0.15, 0.35, 0.5])
+        cause_idx = rng.integers(0, len(root_causes), n)
+        days_to_resolve = rng.integers(1, 31, n)
+
+        for sev, cause, days in zip(sev_idx.tolist(), cause_idx.tolist(), days_to_resolve.tolist()):
+            yield {
+                **base,
+                "severity": severities[sev],
+                "root_cause": root_causes[cause],
+                "days_to_resolve": days,
+            }
 
 # ────────────────────────────────────────────────────────────────────────────────
-# Helper functions (unchanged)
+# Helper functions
 # ────────────────────────────────────────────────────────────────────────────────
 
 def ensure_dir(path: str):
     os.makedirs(path, exist_ok=True)
 
-def write_jsonl(path: str, records):
-    ensure_dir(os.path.dirname(path))
-    with open(path, "w", encoding="utf-8") as f:
-        for r in records:
-            f.write(json.dumps(r, ensure_ascii=False) + "\n")
+JSONL_CHUNK = 10_000  # Records serialized per f.write
+WRITE_BUFFER = 1 << 20  # 1 MiB, vs the 8 KiB default: fewer write() syscalls for small chunks
+
+def write_jsonl(path: str, records, format_line=None):
+    """Stream records (any iterable) to path; returns the number written
+
+    format_line is an optional hand-rolled str formatter for this dataset's
+    fixed schema, used instead of the stdlib encoder when orjson is missing.
+    """
+    count = 0
+    with open(path, "wb", buffering=WRITE_BUFFER) as f:
+        for buf, n in encode_jsonl(records, format_line):
+            f.write(buf)
+            count += n
+    return count
+
+def encode_jsonl(records, format_line=None):
+    """Yield (bytes, record count) for each JSONL_CHUNK records"""
+    records = iter(records)
+    if orjson is not None:
+        # orjson emits UTF-8 bytes directly; encode while slicing so each record
+        # is released as soon as it's serialized
+        while lines := list(map(orjson.dumps, islice(records, JSONL_CHUNK))):
+            yield b"\n".join(lines) + b"\n", len(lines)
+    else:
+        fmt = format_line or json_line
+        while lines := list(map(fmt, islice(records, JSONL_CHUNK))):
+            yield ("\n".join(lines) + "\n").encode("utf-8"), len(lines)
+
+def json_line(r):
+    """Stdlib fallback producing the same compact bytes as orjson.dumps"""
+    return json.dumps(r, ensure_ascii=False, separators=(",", ":"))
+
+JSON_BOOL = ("false", "true")
+
+# Pre-quoted JSON strings for the fixed site/category/brand vocabulary
+JSON_STR = {
+    v: json.dumps(v, ensure_ascii=False)
+    for v in [*(s["code"] for s in SITES), *(s["name"] for s in SITES), *CATEGORIES, *BRAND_TO_CATEGORY]
+}
 
-def write_json(path: str, obj):
-    ensure_dir(os.path.dirname(path))
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(obj, f, ensure_ascii=False, indent=2)
+def format_order_line(r):
+    """Order record as a JSONL line via one f-string, ~3x faster than json.dumps
+
+    Floats are already rounded, so repr matches orjson's output byte for byte.
+    """
+    return (
+        f'{{"month":"{r["month"]}","site":{JSON_STR[r["site"]]},"site_name":{JSON_STR[r["site_name"]]},'
+        f'"category":{JSON_STR[r["category"]]},"brand":{JSON_STR[r["brand"]]},'
+        f'"order_fulfilled":{JSON_BOOL[r["order_fulfilled"]]},"on_time":{JSON_BOOL[r["on_time"]]},'
+        f'"perfect_order":{JSON_BOOL[r["perfect_order"]]},"cycle_time_days":{r["cycle_time_days"]!r},'
+        f'"supplier_lead_time":{r["supplier_lead_time"]!r},"cost_per_order":{r["cost_per_order"]!r},'
+        f'"total_order_cost":{r["total_order_cost"]!r},"cash_to_cash_cycle":{r["cash_to_cash_cycle"]!r},'
+        f'"visibility_score":{r["visibility_score"]!r},"backorder":{JSON_BOOL[r["backorder"]]}}}'
+    )
+
+def write_parquet(path: str, records):
+    """Stream records to a zstd-compressed Parquet file; returns the number written"""
+    # Imported here so the default jsonl run doesn't pay pyarrow's import time
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    records = iter(records)
+    count = 0
+    writer = None
+    try:
+        while chunk := list(islice(records, JSONL_CHUNK)):
+            # The first chunk fixes the schema; later ones are coerced to it
+            # (e.g. a clamped int bound in an otherwise float column)
+            batch = pa.RecordBatch.from_pylist(chunk, schema=writer.schema if writer else None)
+            if writer is None:
+                writer = pq.ParquetWriter(path, batch.schema, compression="zstd")
+            writer.write_batch(batch)
+            count += len(chunk)
+    finally:
+        if writer is not None:
+            writer.close()
+    return count
 
-def rand_weighted_bool(p_true=0.8):
-    return random.random() < p_true
+def write_json(path: str, obj):
+    with open(path, "wb") as f:
+        if orjson is not None:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+        else:
+            f.write(json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8"))
 
 def clamp(v, lo, hi):
     return max(lo, min(hi, v))
 
+def clamp_array(a, lo, hi=None):
+    """Clamp a whole array in place; hi=None only applies the lower bound"""
+    if hi is None:
+        return np.maximum(a, lo, out=a)
+    return np.clip(a, lo, hi, out=a)
+
+def run_generator(gen, months, seed, path, write=write_jsonl):
+    """Stream one generator to path (in a worker or in-process) with its own reproducible seed"""
+    global rng
+    random.seed(seed)
+    rng = make_rng(seed)
+    return write(path, gen(months))
+
 # ────────────────────────────────────────────────────────────────────────────────
 # MAIN EXECUTION
 # ────────────────────────────────────────────────────────────────────────────────
 
 def main():
+    parser = argparse.ArgumentParser(description="Generate mock dashboard data")
+    parser.add_argument(
+        "--format", choices=["jsonl", "parquet"], default="jsonl",
+        help="record file format (the dashboard reads jsonl; parquet needs pyarrow)",
+    )
+    args = parser.parse_args()
+    if args.format == "parquet":
+        try:
+            import pyarrow.parquet  # Availability check only; write_parquet imports it itself
+        except ImportError:
+            parser.error("--format parquet requires pyarrow")
+
     base = "data"
     paths = {
         "orders":            os.path.join(base, "supply", "orders.jsonl"),
@@ -357,29 +451,47 @@ def main():
     }
 
     months = last_n_months(12)
-    print(f"Generating data for months: {months}")
+    print(f"Generating data for months: {list(months)}")
+
+    generators = {
+        "orders":         gen_orders,
+        "batches":        gen_batches,
+        "labs":           gen_labs,
+        "inventory":      gen_inventory,
+        "turnover":       gen_inventory_turnover,
+        "approvals":      gen_reg_approvals,
+        "submissions":    gen_reg_submissions,
+        "supplier_perf":  gen_supplier_performance,
+        "deviations":     gen_deviations,  # NEW
+    }
+
+    writers = dict.fromkeys(generators, write_jsonl)
+    writers["orders"] = partial(write_jsonl, format_line=format_order_line)
+    if args.format == "parquet":
+        writers = dict.fromkeys(generators, write_parquet)
+        for name in generators:
+            paths[name] = os.path.splitext(paths[name])[0] + ".parquet"
+
+    # The output tree is static, so create it once up front; writers assume it exists
+    for d in {os.path.dirname(p) for p in paths.values()}:
+        ensure_dir(d)
 
     print("\n=== Generating comprehensive mock data ===")
-    orders = gen_orders(months)
-    batches = gen_batches(months)
-    labs = gen_labs(months)
-    inventory = gen_inventory(months)
-    turnover = gen_inventory_turnover(months)
-    approvals = gen_reg_approvals(months)
-    submissions = gen_reg_submissions(months)
-    supplier_perf = gen_supplier_performance(months)
-    deviations = gen_deviations(months)  # NEW
-
-    # Write all files
-    write_jsonl(paths["orders"], orders)
-    write_jsonl(paths["batches"], batches)
-    write_jsonl(paths["labs"], labs)
-    write_jsonl(paths["inventory"], inventory)
-    write_jsonl(paths["turnover"], turnover)
-    write_jsonl(paths["approvals"], approvals)
-    write_jsonl(paths["submissions"], submissions)
-    write_jsonl(paths["supplier_perf"], supplier_perf)
-    write_jsonl(paths["deviations"], deviations)  # NEW
+    # Generators are independent, so run them in parallel, each with its own seed;
+    # every worker streams its records straight to its file and reports the count
+    jobs = {
+        name: (gen, months, 42 + i, paths[name], writers[name])
+        for i, (name, gen) in enumerate(generators.items())
+    }
+    workers = min(len(jobs), os.cpu_count() or 1)
+    if workers == 1:
+        # A pool of one only adds process startup; the seeds keep the output identical
+        counts = {name: run_generator(*args) for name, args in jobs.items()}
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            futures = {name: ex.submit(run_generator, *args) for name, args in jobs.items()}
+            counts = {name: f.result() for name, f in futures.items()}
+
     write_json(paths["suppliers_lookup"], SUPPLIERS)
 
     print(f"\n=== SUMMARY ===")
@@ -389,15 +501,15 @@ def main():
     
     print(f"\nRecord counts:")
     totals = {
-        "orders": len(orders),
-        "batches": len(batches), 
-        "labs": len(labs),
-        "inventory": len(inventory),
-        "inventory_turnover": len(turnover),
-        "approvals": len(approvals),
-        "submissions": len(submissions),
-        "supplier_performance": len(supplier_perf),
-        "deviations": len(deviations)
+        "orders": counts["orders"],
+        "batches": counts["batches"], 
+        "labs": counts["labs"],
+        "inventory": counts["inventory"],
+        "inventory_turnover": counts["turnover"],
+        "approvals": counts["approvals"],
+        "submissions": counts["submissions"],
+        "supplier_performance": counts["supplier_perf"],
+        "deviations": counts["deviations"]
     }
     
     for name, count in totals.items():
@@ -406,23 +518,20 @@ def main():
     print(f"\nTotal records generated: {sum(totals.values()):,}")
     print("All charts should now have sufficient data for any filter combination!")
 
-# Keep the existing inventory_turnover function unchanged
 def gen_inventory_turnover(months):
-    records = []
-    for m in months:
-        for site in SITES:
-            for cat in CATEGORIES.keys():
-                turnover = clamp(random.gauss(6.2, 1.8), 2.0, 12.0)
-                inv_acc = clamp(random.gauss(0.955, 0.03), 0.85, 0.995)
-                records.append({
-                    "month": m,
-                    "site": site["code"],
-                    "site_name": site["name"],
-                    "category": cat,
-                    "turnover_ratio": round(turnover, 2),
-                    "inventory_accuracy": round(inv_acc, 3),
-                })
-    return records
+    _gauss, _clamp = random.gauss, clamp
+    for m, site, cat in product(months, SITES, CATEGORIES.keys()):
+        site_code, site_name = site["code"], site["name"]
+        turnover = _clamp(_gauss(6.2, 1.8), 2.0, 12.0)
+        inv_acc = _clamp(_gauss(0.955, 0.03), 0.85, 0.995)
+        yield {
+            "month": m,
+            "site": site_code,
+            "site_name": site_name,
+            "category": cat,
+            "turnover_ratio": round(turnover, 2),
+            "inventory_accuracy": round(inv_acc, 3),
+        }
 
 if __name__ == "__main__":
     main()
\ No newline at end of file